@@ -12,10 +12,21 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
+from adbc_driver_postgresql import dbapi as adbc_dbapi
+from numba import njit
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
 
@@ -28,40 +39,285 @@ DATA_DIR = BASE_DIR / "data" / "MLB_Data_2025"
 # ----------------------------
 # IO helpers
 # ----------------------------
-def load_all_csvs(data_dir: Path, filename: str) -> pd.DataFrame:
+# Explicit Arrow column types per extract so dtype inference never runs (and empty /
+# all-null shards can't disagree on a column's type). Widths follow sql/create_tables.sql.
+GAMES_DTYPES: Dict[str, pa.DataType] = {
+    "gamePk": pa.int32(),
+    "gameDate": pa.timestamp("s", tz="UTC"),
+    "officialDate": pa.date32(),
+    "sportId": pa.int32(),
+    "gameType": pa.string(),
+    "codedGameState": pa.string(),
+    "detailedState": pa.string(),
+    "awayteamid": pa.int32(),
+    "awayteamname": pa.string(),
+    "awayteamscore": pa.int16(),
+    "hometeamid": pa.int32(),
+    "hometeamname": pa.string(),
+    "hometeamscore": pa.int16(),
+    "venueid": pa.int32(),
+    "venuename": pa.string(),
+    "scheduledInnings": pa.int16(),
+}
+
+LINESCORES_DTYPES: Dict[str, pa.DataType] = {
+    "gamePk": pa.int32(),
+    "inning": pa.int16(),
+    "half": pa.int16(),
+    "battingteamid": pa.int32(),
+    "runs": pa.int16(),
+    "hits": pa.int16(),
+    "errors": pa.int16(),
+    "leftOnBase": pa.int16(),
+}
+
+RUNNERS_DTYPES: Dict[str, pa.DataType] = {
+    "gamePk": pa.int32(),
+    "atBatIndex": pa.int16(),
+    "playIndex": pa.int16(),
+    "playId": pa.string(),
+    "runnerid": pa.int32(),
+    "runnerfullName": pa.string(),
+    "originBase": pa.string(),
+    "start": pa.string(),
+    "end": pa.string(),
+    "event": pa.string(),
+    "eventType": pa.string(),
+    "movementReason": pa.string(),
+    "isOut": pa.bool_(),
+    "outBase": pa.string(),
+    "outNumber": pa.int16(),
+    "isScoringEvent": pa.bool_(),
+    "rbi": pa.bool_(),
+    "earned": pa.bool_(),
+    "teamUnearned": pa.bool_(),
+    "responsiblepitcherid": pa.int32(),
+}
+
+# Only the runner columns process_runner_play actually reads
+RUNNERS_USECOLS: List[str] = [
+    "gamePk",
+    "atBatIndex",
+    "playIndex",
+    "playId",
+    "runnerid",
+    "runnerfullName",
+    "originBase",
+    "start",
+    "end",
+    "eventType",
+    "movementReason",
+    "isOut",
+]
+
+
+def _read_fragment(fragment: ds.Fragment, schema: pa.Schema) -> pa.Table:
+    """Read one CSV shard and tag it with the date folder it came from."""
+    path = Path(fragment.path)
+    folder_date = path.parent.parent.name or path.parent.name
+
+    table = fragment.to_table(schema=schema, use_threads=False)
+    return table.append_column("source_folder_date", pa.repeat(folder_date, table.num_rows))
+
+
+def load_all_csvs(
+    data_dir: Path,
+    filename: str,
+    dtype: Dict[str, pa.DataType],
+    usecols: Optional[List[str]] = None,
+) -> pd.DataFrame:
     """
     Recursively find all occurrences of `filename` under `data_dir` and concatenate.
     Adds source_folder_date for dedupe preference.
     Expected structure: <date>/.../<filename>
+
+    `dtype` pins every column's Arrow type; `usecols` (default: all of `dtype`)
+    limits which columns are parsed at all.
+
+    Shards are scanned as a single pyarrow dataset, parsed on a thread pool
+    and returned as an Arrow-backed pandas frame.
     """
-    dfs: List[pd.DataFrame] = []
+    paths = sorted(str(p) for p in data_dir.rglob(filename))
+    if not paths:
+        raise FileNotFoundError(f"No files named {filename} found under {data_dir}")
 
-    for path in data_dir.rglob(filename):
-        try:
-            folder_date = path.parent.parent.name
-        except Exception:
-            folder_date = path.parent.name
+    # The dataset schema doubles as the projection: columns outside it are never converted
+    usecols = usecols or list(dtype)
+    schema = pa.schema([(c, dtype[c]) for c in usecols])
 
-        df = pd.read_csv(path)
-        df["source_folder_date"] = folder_date
-        dfs.append(df)
+    csv_format = ds.CsvFileFormat(
+        convert_options=pv.ConvertOptions(
+            column_types=dtype,
+            strings_can_be_null=True,
+        )
+    )
+    dataset = ds.dataset(paths, schema=schema, format=csv_format)
+
+    # Shards are small and independent; parse them concurrently (Arrow releases the GIL)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        tables: List[pa.Table] = list(ex.map(partial(_read_fragment, schema=dataset.schema), dataset.get_fragments()))
+
+    return pa.concat_tables(tables).to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# Arrow types matching sql/create_tables.sql. Binary COPY sends raw wire values, so
+# every column has to arrive at exactly the width/encoding Postgres expects.
+TABLE_SCHEMAS: Dict[str, pa.Schema] = {
+    "game": pa.schema(
+        [
+            ("gamepk", pa.int32()),
+            ("gamedate", pa.timestamp("us")),
+            ("officialdate", pa.date32()),
+            ("sportid", pa.int32()),
+            ("gametype", pa.string()),
+            ("codedgamestate", pa.string()),
+            ("detailedstate", pa.string()),
+            ("awayteamid", pa.int32()),
+            ("awayteamname", pa.string()),
+            ("awayteamscore", pa.int16()),
+            ("hometeamid", pa.int32()),
+            ("hometeamname", pa.string()),
+            ("hometeamscore", pa.int16()),
+            ("venueid", pa.int32()),
+            ("venuename", pa.string()),
+            ("scheduledinnings", pa.int16()),
+        ]
+    ),
+    "linescore": pa.schema(
+        [
+            ("gamepk", pa.int32()),
+            ("inning", pa.int16()),
+            ("half", pa.int16()),
+            ("battingteamid", pa.int32()),
+            ("runs", pa.int16()),
+            ("hits", pa.int16()),
+            ("errors", pa.int16()),
+            ("leftonbase", pa.int16()),
+            ("battingteam_score", pa.int16()),
+            ("battingteam_score_diff", pa.int16()),
+        ]
+    ),
+    "runner_play": pa.schema(
+        [
+            ("gamepk", pa.int32()),
+            ("atbatindex", pa.int16()),
+            ("playindex", pa.int16()),
+            ("runnerid", pa.int32()),
+            ("playid", pa.binary(16)),  # UUID travels as its 16 raw bytes
+            ("runnerfullname", pa.string()),
+            ("startbase", pa.string()),
+            ("endbase", pa.string()),
+            ("reachedbase", pa.string()),
+            ("is_out", pa.bool_()),
+            ("eventtype", pa.string()),
+            ("movementreason", pa.string()),
+            ("is_risp", pa.bool_()),
+            ("is_firsttothird", pa.bool_()),
+            ("is_secondtohome", pa.bool_()),
+        ]
+    ),
+}
 
-    if not dfs:
-        raise FileNotFoundError(f"No files named {filename} found under {data_dir}")
 
-    return pd.concat(dfs, ignore_index=True)
+# ASCII byte -> hex nibble (255 = not a hex digit)
+_HEX_NIBBLES = np.full(256, 255, dtype=np.uint8)
+_HEX_NIBBLES[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_NIBBLES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_NIBBLES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
 
 
-def to_sql_append(engine: Engine, table: str, df: pd.DataFrame, chunksize: int = 5000) -> None:
-    """Append a DataFrame to an existing table, preserving schema/constraints."""
-    df = df.copy()
-    df.columns = [c.lower() for c in df.columns]
-    df.to_sql(table, engine, if_exists="append", index=False, method="multi", chunksize=chunksize)
+def uuid_strings_to_bytes(col: pa.ChunkedArray) -> pa.Array:
+    """
+    Convert canonical UUID strings to their 16 raw bytes (Postgres' binary uuid
+    format) with one vectorized hex decode; nulls stay null.
+    """
+    # Header-only shards can leave nothing to decode (and no data buffer to read)
+    if len(col) == 0:
+        return pa.array([], type=pa.binary(16))
+
+    hex_digits = pc.replace_substring(col, "-", "").combine_chunks()
+    valid = hex_digits.is_valid()
+    hex_digits = hex_digits.fill_null("0" * 32).cast(pa.large_string())
+
+    if not pc.all(pc.equal(pc.utf8_length(hex_digits), 32)).as_py():
+        raise ValueError("Expected 32 hex digits per UUID")
+
+    # Every value is exactly 32 bytes, so the data buffer is a dense (n, 32) matrix
+    offsets = np.frombuffer(hex_digits.buffers()[1], dtype=np.int64)
+    start, end = offsets[hex_digits.offset], offsets[hex_digits.offset + len(hex_digits)]
+    chars = np.frombuffer(hex_digits.buffers()[2], dtype=np.uint8)[start:end].reshape(-1, 32)
+    nibbles = _HEX_NIBBLES[chars]
+    if (nibbles == 255).any():
+        raise ValueError("UUID contains non-hex characters")
+
+    raw = (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+    uuids = pa.FixedSizeBinaryArray.from_buffers(pa.binary(16), len(raw), [None, pa.py_buffer(raw.tobytes())])
+    return pc.if_else(valid, uuids, pa.scalar(None, type=pa.binary(16)))
+
+
+def to_arrow_table(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """Project and cast a (lowercase-column) DataFrame onto a target table schema."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    columns = []
+    for field in schema:
+        col = table.column(field.name)
+        if field.type == pa.binary(16) and (pa.types.is_string(col.type) or pa.types.is_large_string(col.type)):
+            col = uuid_strings_to_bytes(col)
+        else:
+            col = col.cast(field.type)
+        columns.append(col)
+
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+# Target tables in foreign-key order; each is bulk loaded into an UNLOGGED "<table>_stage" copy first
+LOAD_TABLES: List[str] = ["game", "linescore", "runner_play"]
+
+
+def stage_table(table: str) -> str:
+    return f"{table}_stage"
+
+
+def to_sql_append(engine: Engine, table: str, df: pd.DataFrame) -> None:
+    """
+    Append a DataFrame to the unlogged staging copy of `table` (see prepare_staging_tables).
+    Hands an Arrow table to ADBC's Postgres driver, which streams it with binary COPY.
+    Expects lowercase column names, as returned by the process_* transforms.
+    """
+    arrow_table = to_arrow_table(df, TABLE_SCHEMAS[table])
+
+    uri = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+    with adbc_dbapi.connect(uri) as conn:
+        with conn.cursor() as cur:
+            cur.adbc_ingest(stage_table(table), arrow_table, mode="append")
+        conn.commit()
+
+
+def prepare_staging_tables(engine):
+    """
+    (Re)create empty UNLOGGED staging tables shaped like the targets. Staging skips
+    WAL and has no foreign keys, so tables can load in any order. The live tables
+    are left untouched until publish_staged_tables.
+    """
+    with engine.begin() as conn:
+        for table in LOAD_TABLES:
+            conn.execute(text(f"CREATE UNLOGGED TABLE IF NOT EXISTS {stage_table(table)} (LIKE {table} INCLUDING ALL);"))
+        conn.execute(text(f"TRUNCATE TABLE {', '.join(stage_table(t) for t in LOAD_TABLES)};"))
 
 
-def truncate_tables(engine):
+def publish_staged_tables(engine):
+    """
+    Replace the target tables' contents with the staged rows and empty the staging
+    tables, all in one transaction: a failed load leaves the targets as they were.
+    """
+    stage_tables = ", ".join(stage_table(t) for t in LOAD_TABLES)
     with engine.begin() as conn:
-        conn.execute(text("TRUNCATE TABLE runner_play, linescore, game;"))
+        conn.execute(text("SET LOCAL synchronous_commit = off;"))
+        conn.execute(text(f"TRUNCATE TABLE {', '.join(reversed(LOAD_TABLES))};"))
+        for table in LOAD_TABLES:
+            conn.execute(text(f"INSERT INTO {table} SELECT * FROM {stage_table(table)};"))
+        conn.execute(text(f"TRUNCATE TABLE {stage_tables};"))
 
 
 # ----------------------------
@@ -71,88 +327,196 @@ def process_games(df_games_raw: pd.DataFrame) -> pd.DataFrame:
     """
     Keep the most recent schedule row per gamePk (based on source_folder_date).
     """
-    df = df_games_raw.copy()
-    df = df.sort_values(["gamePk", "source_folder_date"], ascending=[True, False])
+    df = df_games_raw.sort_values(["gamePk", "source_folder_date"], ascending=[True, False])
     df = df.drop_duplicates(subset=["gamePk"], keep="first")
     df = df.drop(columns=["source_folder_date"], errors="ignore")
+    df.columns = [c.lower() for c in df.columns]
     return df
 
 
 # ----------------------------
 # Transform: linescores
 # ----------------------------
+@njit(cache=True)
+def _running_scores(game_ids: np.ndarray, team_ids: np.ndarray, team_valid: np.ndarray, runs: np.ndarray):
+    """
+    Single fused pass over half innings sorted by (gamePk, inning, half).
+    Returns battingteam_score and battingteam_score_diff at the start of each
+    half inning: both scores are written before the current runs are added,
+    which is the "shift by one" without any intermediate cumulative arrays.
+    Requires at most two distinct non-null team ids per game (validated by
+    process_linescores): the running totals are just two scalars reset at every
+    game boundary, and any team other than the game's first is counted as the other.
+    Half innings without a team (team_valid false) get 0 and count toward neither.
+    """
+    n = runs.shape[0]
+    battingteam_score = np.empty(n, dtype=np.int32)
+    battingteam_score_diff = np.empty(n, dtype=np.int32)
+
+    prev_game = game_ids[0] if n else 0
+    have_first_team = False
+    first_team = 0
+    first_team_cum = 0
+    other_team_cum = 0
+    for i in range(n):
+        if game_ids[i] != prev_game:
+            prev_game = game_ids[i]
+            have_first_team = False
+            first_team_cum = 0
+            other_team_cum = 0
+
+        if not team_valid[i]:
+            battingteam_score[i] = 0
+            battingteam_score_diff[i] = 0
+            continue
+        if not have_first_team:
+            first_team = team_ids[i]
+            have_first_team = True
+
+        if team_ids[i] == first_team:
+            battingteam_score[i] = first_team_cum
+            battingteam_score_diff[i] = first_team_cum - other_team_cum
+            first_team_cum += runs[i]
+        else:
+            battingteam_score[i] = other_team_cum
+            battingteam_score_diff[i] = other_team_cum - first_team_cum
+            other_team_cum += runs[i]
+
+    return battingteam_score, battingteam_score_diff
+
+
 def process_linescores(df_linescores_raw: pd.DataFrame) -> pd.DataFrame:
     """
     Deduplicate (gamePk, inning, half) across dates.
     Compute:
       - battingteam_score: batting team runs at start of half inning
       - battingteam_score_diff: batting - fielding at start of half inning
-    """
-    df = df_linescores_raw.copy()
 
-    # Deduplicate repeated extracts (prefer most recent folder date)
-    df = df.sort_values(["gamePk", "inning", "half", "source_folder_date"], ascending=[True, True, True, False])
-    df = df.drop_duplicates(subset=["gamePk", "inning", "half"], keep="first")
-
-    # Runs may be NaN in the source
-    df["runs"] = df["runs"].fillna(0).astype(int)
-
-    # Ensure chronological order for correct running totals
-    df = df.sort_values(["gamePk", "inning", "half"]).copy()
-
-    # Cumulative runs for each batting team and total, then shift to get "start of half inning"
-    df["cum_runs_batting"] = df.groupby(["gamePk", "battingteamid"])["runs"].cumsum()
-    df["cum_runs_total"] = df.groupby("gamePk")["runs"].cumsum()
-
-    df["battingteam_score"] = (
-        df.groupby(["gamePk", "battingteamid"])["cum_runs_batting"]
-        .shift(1)
-        .fillna(0)
-        .astype(int)
+    Sort and dedupe run as a polars lazy pipeline; the running totals are a
+    single compiled pass over the sorted rows.
+    """
+    keys = ["gamePk", "inning", "half"]
+
+    df = (
+        pl.from_pandas(df_linescores_raw)
+        .lazy()
+        # Deduplicate repeated extracts (prefer most recent folder date)
+        .sort("source_folder_date", descending=True, maintain_order=True)
+        .unique(subset=keys, keep="first", maintain_order=True)
+        # Chronological order for the running totals
+        .sort(keys)
+        # Runs may be null in the source
+        .with_columns(pl.col("runs").fill_null(0))
+        .drop("source_folder_date")
+        .collect()
     )
-    df["total_score"] = (
-        df.groupby("gamePk")["cum_runs_total"]
-        .shift(1)
-        .fillna(0)
-        .astype(int)
+
+    # _running_scores tracks at most two batting teams per game; refuse input it would miscount
+    n_teams = pl.col("battingteamid").drop_nulls().n_unique().over("gamePk")
+    extra_teams = df.filter(n_teams > 2).get_column("gamePk").unique()
+    if len(extra_teams):
+        raise ValueError(f"Expected at most two batting teams per game; gamePk {extra_teams.to_list()[:5]} has more")
+
+    battingteamid = df.get_column("battingteamid")
+    battingteam_score, battingteam_score_diff = _running_scores(
+        df.get_column("gamePk").to_numpy(),
+        battingteamid.fill_null(0).to_numpy(),
+        battingteamid.is_not_null().to_numpy(),
+        df.get_column("runs").to_numpy(),
     )
 
-    df["battingteam_score_diff"] = df["battingteam_score"] - (df["total_score"] - df["battingteam_score"])
+    df = df.with_columns(
+        pl.Series("battingteam_score", battingteam_score),
+        pl.Series("battingteam_score_diff", battingteam_score_diff),
+    )
 
-    df = df.drop(columns=["cum_runs_batting", "cum_runs_total", "total_score", "source_folder_date"], errors="ignore")
-    return df
+    df = df.rename(str.lower)
+    return df.to_pandas(use_pyarrow_extension_array=True)
 
 
 # ----------------------------
 # Transform: runner_play
 # ----------------------------
-BASE_MAP_REPLACE = {
-    "score": "HM",
-    "4B": "HM",
-}
+# Source spellings of home plate, standardized to HM
+HOME_ALIASES = ("score", "4B")
 
 
-def uniq_join_keep_dups(s: pd.Series) -> Optional[str]:
+def _remap_home(col: pd.Series) -> pd.Series:
     """
-    Join unique labels observed during the play into a comma-separated string.
-    This is used to avoid losing information when multiple movement reasons/eventtypes
-    occur across segments.
+    Standardize home representation (every HOME_ALIASES value -> HM)
+    with a single Arrow exact-match pass instead of pandas' generic replace.
     """
-    vals = [v for v in s.dropna().astype(str).tolist() if v != ""]
-    if not vals:
-        return None
-    vals = sorted(set(vals))
-    return ",".join(vals)
-
-
-def calculate_reached_base(group: pd.DataFrame) -> str:
+    arr = pa.array(col)
+    remapped = pc.if_else(pc.is_in(arr, value_set=pa.array(HOME_ALIASES)), "HM", arr)
+    return pd.Series(pd.array(remapped, dtype=col.dtype), index=col.index, name=col.name)
+
+
+@njit(cache=True)
+def _aggregate_plays(
+    bounds: np.ndarray,
+    is_out: np.ndarray,
+    first_valid: np.ndarray,
+    endbase_valid: np.ndarray,
+    eventtype_codes: np.ndarray,
+    n_eventtypes: int,
+    movementreason_codes: np.ndarray,
+    n_movementreasons: int,
+):
+    """
+    Run-length reduction over segments sorted by play key, one group per
+    bounds[g]:bounds[g + 1] slice. is_out is 1/0 with -1 for missing; label
+    codes are -1 for missing; first_valid is an (n_rows, n_cols) non-null mask
+    for the columns aggregated with "first". Returns, per group: index of the
+    first non-null value of each first_valid column (-1 if none), index of the
+    last non-null endbase and of the last safe one (-1 if none), max is_out
+    (-1 if all missing) and which eventtype / movementreason codes were seen.
+    Null handling matches pandas' groupby first/last/max, which skip nulls.
     """
-    reachedbase: last base reached safely on the play; if never safe, startbase.
+    n_groups = bounds.shape[0] - 1
+    first_idx = np.full((n_groups, first_valid.shape[1]), -1, dtype=np.int64)
+    endbase_idx = np.full(n_groups, -1, dtype=np.int64)
+    last_safe_idx = np.full(n_groups, -1, dtype=np.int64)
+    is_out_max = np.full(n_groups, -1, dtype=np.int8)
+    eventtype_seen = np.zeros((n_groups, n_eventtypes), dtype=np.bool_)
+    movementreason_seen = np.zeros((n_groups, n_movementreasons), dtype=np.bool_)
+
+    for g in range(n_groups):
+        for i in range(bounds[g], bounds[g + 1]):
+            for c in range(first_valid.shape[1]):
+                if first_idx[g, c] < 0 and first_valid[i, c]:
+                    first_idx[g, c] = i
+            if endbase_valid[i]:
+                endbase_idx[g] = i
+            if is_out[i] >= 0:
+                if is_out[i] > is_out_max[g]:
+                    is_out_max[g] = is_out[i]
+                if is_out[i] == 0 and endbase_valid[i]:
+                    last_safe_idx[g] = i
+            if eventtype_codes[i] >= 0:
+                eventtype_seen[g, eventtype_codes[i]] = True
+            if movementreason_codes[i] >= 0:
+                movementreason_seen[g, movementreason_codes[i]] = True
+
+    return first_idx, endbase_idx, last_safe_idx, is_out_max, eventtype_seen, movementreason_seen
+
+
+def join_labels(seen: np.ndarray, labels: np.ndarray) -> pd.api.extensions.ExtensionArray:
     """
-    safe_segments = group[group["is_out"] == False]
-    if not safe_segments.empty:
-        return safe_segments["endbase"].iloc[-1]
-    return group["startbase"].iloc[0]
+    Join the unique labels observed during each play into a comma-separated string
+    (None when there are none). This is used to avoid losing information when multiple
+    movement reasons/eventtypes occur across segments. `labels` must be sorted; each
+    distinct row of `seen` is joined once.
+    """
+    patterns, inverse = np.unique(seen, axis=0, return_inverse=True)
+    joined = pa.array([",".join(labels[row]) or None for row in patterns], type=pa.string())
+    return pd.arrays.ArrowExtensionArray(joined.take(inverse.reshape(-1)))
+
+
+def _matches(col: pd.Series, pattern: str, exact: bool = True) -> np.ndarray:
+    """Null-safe Arrow string equality (or substring match) as a plain bool array."""
+    arr = pa.array(col)
+    mask = pc.equal(arr, pattern) if exact else pc.match_substring(arr, pattern)
+    return mask.fill_null(False).to_numpy(zero_copy_only=False)
 
 
 def process_runner_play(df_runners_raw: pd.DataFrame) -> pd.DataFrame:
@@ -160,14 +524,13 @@ def process_runner_play(df_runners_raw: pd.DataFrame) -> pd.DataFrame:
     Deduplicate runner movement segments and aggregate into one row per
     (gamepk, atbatindex, playindex, runnerid).
     """
-    df = df_runners_raw.copy()
+    # Deduplicate repeated extracts and identical segments (newest folder date first wins)
+    segment_keys = ["gamePk", "atBatIndex", "playIndex", "runnerid", "start", "end"]
+    df = df_runners_raw.sort_values("source_folder_date", ascending=False, kind="stable")
+    df = df.drop_duplicates(subset=segment_keys, keep="first")
 
-    # Deduplicate repeated extracts and identical segments
-    df = df.sort_values(
-        ["gamePk", "atBatIndex", "playIndex", "runnerid", "start", "end", "source_folder_date"],
-        ascending=[True, True, True, True, True, True, False],
-    )
-    df = df.drop_duplicates(subset=["gamePk", "atBatIndex", "playIndex", "runnerid", "start", "end"], keep="first")
+    # Segment order within a play drives the first/last aggregates below
+    df = df.sort_values(segment_keys, kind="stable")
 
     # Rename to match schema intent
     df = df.rename(
@@ -187,43 +550,65 @@ def process_runner_play(df_runners_raw: pd.DataFrame) -> pd.DataFrame:
             df[col] = df[col].fillna("B")
 
     # Standardize home representation
-    df["endbase"] = df["endbase"].replace(BASE_MAP_REPLACE)
-    if "outbase" in df.columns:
-        df["outbase"] = df["outbase"].replace(BASE_MAP_REPLACE)
-
-    # Ensure chronological order for first/last aggregates
-    df = df.sort_values(["gamepk", "atbatindex", "playindex"]).copy()
-
-    grouped = df.groupby(["gamepk", "atbatindex", "playindex", "runnerid"], sort=False)
-
-    out = grouped.agg(
-        startbase=("startbase", "first"),
-        endbase=("endbase", "last"),
-        runnerfullname=("runnerfullname", "first"),
-        reachedbase=("endbase", lambda x: calculate_reached_base(df.loc[x.index])),
-        eventtype=("eventtype", uniq_join_keep_dups),
-        movementreason=("movementreason", uniq_join_keep_dups),
-        is_out=("is_out", "max"),
-        playid=("playid", "first"),
-    ).reset_index()
-
-    # Derived metrics
-    out["is_risp"] = out["startbase"].isin(["2B", "3B"])
-
-    out["is_firsttothird"] = (
-        (out["startbase"] == "1B")
-        & (out["reachedbase"] == "3B")
-        & (~out["eventtype"].str.contains("home_run", na=False))
-        & (out["is_out"] == False)
+    df["endbase"] = _remap_home(df["endbase"])
+
+    # Group boundaries: the segment sort above orders rows by play key, so each play is a contiguous run
+    keys = ["gamepk", "atbatindex", "playindex", "runnerid"]
+    n = len(df)
+    starts = np.zeros(n, dtype=bool)
+    starts[:1] = True
+    for c in keys:
+        k = df[c].to_numpy()
+        starts[1:] |= k[1:] != k[:-1]
+    bounds = np.append(np.flatnonzero(starts), n)
+    first_idx = bounds[:-1]
+
+    eventtype_codes, eventtype_labels = pd.factorize(df["eventtype"], sort=True)
+    movementreason_codes, movementreason_labels = pd.factorize(df["movementreason"], sort=True)
+
+    # Columns aggregated with "first" (first non-null value per play)
+    first_cols = ["startbase", "runnerfullname", "playid"]
+    first_valid_idx, endbase_idx, last_safe_idx, is_out_max, eventtype_seen, movementreason_seen = _aggregate_plays(
+        bounds,
+        df["is_out"].astype(pd.ArrowDtype(pa.int8())).to_numpy(dtype=np.int8, na_value=-1),
+        df[first_cols].notna().to_numpy(),
+        df["endbase"].notna().to_numpy(),
+        eventtype_codes,
+        len(eventtype_labels),
+        movementreason_codes,
+        len(movementreason_labels),
     )
+    startbase_idx, runnerfullname_idx, playid_idx = first_valid_idx.T
 
-    out["is_secondtohome"] = (
-        (out["startbase"] == "2B")
-        & (out["reachedbase"] == "HM")
-        & (~out["eventtype"].str.contains("home_run", na=False))
-        & (out["is_out"] == False)
+    def take(col: str, idx: np.ndarray) -> pd.api.extensions.ExtensionArray:
+        return df[col].array.take(idx, allow_fill=True)
+
+    # reachedbase: last base reached safely on the play; if never safe, startbase.
+    has_safe = last_safe_idx >= 0
+    reachedbase = pc.if_else(
+        has_safe,
+        pa.array(take("endbase", last_safe_idx)),
+        pa.array(take("startbase", startbase_idx)),
     )
 
+    out = pd.DataFrame({c: take(c, first_idx) for c in keys})
+    out["startbase"] = take("startbase", startbase_idx)
+    out["endbase"] = take("endbase", endbase_idx)
+    out["runnerfullname"] = take("runnerfullname", runnerfullname_idx)
+    out["reachedbase"] = pd.arrays.ArrowExtensionArray(reachedbase)
+    out["eventtype"] = join_labels(eventtype_seen, np.asarray(eventtype_labels, dtype=object))
+    out["movementreason"] = join_labels(movementreason_seen, np.asarray(movementreason_labels, dtype=object))
+    out["is_out"] = pd.arrays.ArrowExtensionArray(pa.array(is_out_max == 1, mask=is_out_max < 0))
+    out["playid"] = take("playid", playid_idx)
+
+    # Derived metrics (shared masks computed once, evaluated on the Arrow string buffers)
+    not_hr = ~_matches(out["eventtype"], "home_run", exact=False)
+    is_out = out["is_out"].to_numpy(dtype=bool, na_value=True)
+
+    out["is_risp"] = out["startbase"].isin(["2B", "3B"])
+    out["is_firsttothird"] = _matches(out["startbase"], "1B") & _matches(out["reachedbase"], "3B") & not_hr & ~is_out
+    out["is_secondtohome"] = _matches(out["startbase"], "2B") & _matches(out["reachedbase"], "HM") & not_hr & ~is_out
+
     return out
 
 
@@ -252,30 +637,38 @@ def main() -> int:
     engine = create_engine(args.db_uri)
 
     LOG.info("Loading raw CSVs...")
-    df_games_raw = load_all_csvs(data_dir, "games.csv")
-    df_linescores_raw = load_all_csvs(data_dir, "linescores.csv")
-    df_runners_raw = load_all_csvs(data_dir, "runners.csv")
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_games = ex.submit(load_all_csvs, data_dir, "games.csv", GAMES_DTYPES)
+        f_linescores = ex.submit(load_all_csvs, data_dir, "linescores.csv", LINESCORES_DTYPES)
+        f_runners = ex.submit(load_all_csvs, data_dir, "runners.csv", RUNNERS_DTYPES, RUNNERS_USECOLS)
+        df_games_raw, df_linescores_raw, df_runners_raw = f_games.result(), f_linescores.result(), f_runners.result()
 
     LOG.info("Processing games...")
     df_games = process_games(df_games_raw)
+    del df_games_raw
 
     LOG.info("Processing linescores...")
     df_linescores = process_linescores(df_linescores_raw)
+    del df_linescores_raw
 
     LOG.info("Processing runner_play...")
     df_runner_play = process_runner_play(df_runners_raw)
-
-    LOG.info("Truncating tables...")
-    truncate_tables(engine)
-
-    LOG.info("Loading game...")
-    to_sql_append(engine, "game", df_games)
-
-    LOG.info("Loading linescore...")
-    to_sql_append(engine, "linescore", df_linescores)
-
-    LOG.info("Loading runner_play...")
-    to_sql_append(engine, "runner_play", df_runner_play)
+    del df_runners_raw
+
+    LOG.info("Preparing staging tables...")
+    prepare_staging_tables(engine)
+
+    LOG.info("Loading staging tables...")
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        f_game = ex.submit(to_sql_append, engine, "game", df_games)
+        f_linescore = ex.submit(to_sql_append, engine, "linescore", df_linescores)
+        f_runner_play = ex.submit(to_sql_append, engine, "runner_play", df_runner_play)
+        f_game.result()
+        f_linescore.result()
+        f_runner_play.result()
+
+    LOG.info("Publishing staged tables...")
+    publish_staged_tables(engine)
 
     LOG.info("Done.")
     return 0